@@ -1,5 +1,5 @@
 import json
-from typing import List
+from typing import Iterator, List
 from unittest import mock
 
 import pytest
@@ -18,40 +18,64 @@ from lib.webdriver import WebDriver
 # pylint: disable=protected-access
 
 
-@pytest.fixture
-def test_flights(mocker: MockerFixture) -> List[Flight]:
-    mocker.patch.object(Flight, "_set_flight_time")
+@pytest.fixture(scope="module")
+def _flight_template() -> List[Flight]:
     flight_info = {
         "departureAirport": {"name": None},
         "arrivalAirport": {"name": None, "country": None},
         "departureTime": None,
         "flights": [{"number": "100"}],
     }
-    return [Flight(flight_info, ""), Flight(flight_info, "")]
+
+    # The mocker fixture is function-scoped, so patch manually for the module-scoped flights
+    with mock.patch.object(Flight, "_set_flight_time"):
+        return [Flight(flight_info, ""), Flight(flight_info, "")]
+
+
+@pytest.fixture
+def test_flights(_flight_template: List[Flight]) -> List[Flight]:
+    # Tests only rebind attributes on the flights, so copying the attribute dict is enough
+    flights = []
+    for template in _flight_template:
+        flight = Flight.__new__(Flight)
+        flight.__dict__.update(template.__dict__)
+        flights.append(flight)
+
+    return flights
 
 
 class TestCheckInScheduler:
+    @pytest.fixture(autouse=True, scope="class")
+    def _set_up_scheduler(self, request: pytest.FixtureRequest) -> None:
+        # Build the scheduler once for the whole class. Class-scoped fixtures run on a separate
+        # instance, so the scheduler needs to be attached to the class itself
+        request.cls.scheduler = CheckInScheduler(ReservationMonitor(ReservationConfig()))
+
     @pytest.fixture(autouse=True)
-    def _set_up_scheduler(self) -> None:
-        # pylint: disable=attribute-defined-outside-init
-        self.scheduler = CheckInScheduler(ReservationMonitor(ReservationConfig()))
+    def _reset_scheduler(self) -> Iterator[None]:
+        yield
+        # Clear any state a test left behind so it doesn't leak into the next test
+        self.scheduler.headers = {}
+        self.scheduler.flights = []
+        self.scheduler.checkin_handlers = []
 
     def test_process_reservations_handles_all_reservations(self, mocker: MockerFixture) -> None:
-        mock_get_flights = mocker.patch.object(
-            CheckInScheduler, "_get_flights", return_value=["flight"]
-        )
-        mock_get_new_flights = mocker.patch.object(
-            CheckInScheduler, "_get_new_flights", return_value=["flight"]
+        mocks = mocker.patch.multiple(
+            CheckInScheduler,
+            _get_flights=mock.DEFAULT,
+            _get_new_flights=mock.DEFAULT,
+            _schedule_flights=mock.DEFAULT,
+            _remove_old_flights=mock.DEFAULT,
         )
-        mock_schedule_flights = mocker.patch.object(CheckInScheduler, "_schedule_flights")
-        mock_remove_old_flights = mocker.patch.object(CheckInScheduler, "_remove_old_flights")
+        mocks["_get_flights"].return_value = ["flight"]
+        mocks["_get_new_flights"].return_value = ["flight"]
 
         self.scheduler.process_reservations(["test1", "test2"])
 
-        mock_get_flights.assert_has_calls([mock.call("test1"), mock.call("test2")])
-        mock_get_new_flights.assert_called_once_with(["flight", "flight"])
-        mock_schedule_flights.assert_called_once_with(["flight"])
-        mock_remove_old_flights.assert_called_once_with(["flight", "flight"])
+        mocks["_get_flights"].assert_has_calls([mock.call("test1"), mock.call("test2")])
+        mocks["_get_new_flights"].assert_called_once_with(["flight", "flight"])
+        mocks["_schedule_flights"].assert_called_once_with(["flight"])
+        mocks["_remove_old_flights"].assert_called_once_with(["flight", "flight"])
 
     def test_refresh_headers_sets_new_headers(self, mocker: MockerFixture) -> None:
         mock_webdriver_set_headers = mocker.patch.object(WebDriver, "set_headers")
@@ -87,57 +111,39 @@ class TestCheckInScheduler:
         reservation_info = self.scheduler._get_reservation_info("flight1")
         assert reservation_info == [{"test": "reservation"}]
 
-    # A reservation has flights in the past and this is the first time attempting to
-    # schedule it
-    def test_get_reservation_info_sends_error_notification_when_reservation_not_found(
-        self, mocker: MockerFixture
+    @pytest.mark.parametrize(
+        ["error_code", "prefill_flights", "expected_notifications"],
+        [
+            # A reservation has flights in the past and this is the first time attempting to
+            # schedule it
+            pytest.param(FLIGHT_IN_PAST_CODE, False, 1, id="reservation_not_found"),
+            # A reservation is already scheduled but fails for a retrieval resulting in another
+            # error than all flights being old
+            pytest.param(None, True, 1, id="retrieval_fails_and_flight_scheduled"),
+            # A reservation is already scheduled and the flights are in the past
+            pytest.param(FLIGHT_IN_PAST_CODE, True, 0, id="scheduled_reservation_is_old"),
+        ],
+    )
+    def test_get_reservation_info_sends_error_notification_unless_scheduled_reservation_is_old(
+        self,
+        mocker: MockerFixture,
+        test_flights: List[Flight],
+        error_code: int,
+        prefill_flights: bool,
+        expected_notifications: int,
     ) -> None:
+        response_body = "" if error_code is None else json.dumps({"code": error_code})
         mocker.patch(
-            "lib.checkin_scheduler.make_request",
-            side_effect=RequestError("", json.dumps({"code": FLIGHT_IN_PAST_CODE})),
+            "lib.checkin_scheduler.make_request", side_effect=RequestError("", response_body)
         )
         mock_failed_reservation_retrieval = mocker.patch.object(
             NotificationHandler, "failed_reservation_retrieval"
         )
 
-        self.scheduler.flights = []
+        self.scheduler.flights = test_flights if prefill_flights else []
         reservation_info = self.scheduler._get_reservation_info("flight1")
 
-        mock_failed_reservation_retrieval.assert_called_once()
-        assert reservation_info == []
-
-    # A reservation is already scheduled but fails for a retrieval resulting in another error than
-    # all flights being old
-    def test_get_reservation_info_sends_error_when_reservation_retrieval_fails_and_flight_scheduled(
-        self, mocker: MockerFixture, test_flights: List[Flight]
-    ) -> None:
-        mocker.patch("lib.checkin_scheduler.make_request", side_effect=RequestError("", ""))
-        mock_failed_reservation_retrieval = mocker.patch.object(
-            NotificationHandler, "failed_reservation_retrieval"
-        )
-
-        self.scheduler.flights = test_flights
-        reservation_info = self.scheduler._get_reservation_info("flight1")
-
-        mock_failed_reservation_retrieval.assert_called_once()
-        assert reservation_info == []
-
-    # A reservation is already scheduled and the flights are in the past
-    def test_get_reservation_info_does_not_send_error_notification_when_reservation_is_old(
-        self, mocker: MockerFixture, test_flights: List[Flight]
-    ) -> None:
-        mocker.patch(
-            "lib.checkin_scheduler.make_request",
-            side_effect=RequestError("", json.dumps({"code": FLIGHT_IN_PAST_CODE})),
-        )
-        mock_failed_reservation_retrieval = mocker.patch.object(
-            NotificationHandler, "failed_reservation_retrieval"
-        )
-
-        self.scheduler.flights = test_flights
-        reservation_info = self.scheduler._get_reservation_info("flight1")
-
-        mock_failed_reservation_retrieval.assert_not_called()
+        assert mock_failed_reservation_retrieval.call_count == expected_notifications
         assert reservation_info == []
 
     def test_get_new_flights_gets_flights_not_already_scheduled(
@@ -167,18 +173,19 @@ class TestCheckInScheduler:
         mock_new_flights_notification.assert_called_once_with(test_flights)
 
     def test_remove_old_flights_removes_flights_not_currently_scheduled(
-        self, mocker: MockerFixture, test_flights: List[Flight]
+        self, test_flights: List[Flight]
     ) -> None:
         test_flights[0].flight_number = "101"
-        mock_stop_check_in = mocker.patch.object(CheckInHandler, "stop_check_in")
-        self.scheduler.flights = test_flights
-        self.scheduler.checkin_handlers = [
-            CheckInHandler(self.scheduler, test_flights[0], None),
-            CheckInHandler(self.scheduler, test_flights[1], None),
+        mock_checkin_handlers = [
+            mock.MagicMock(spec=CheckInHandler),
+            mock.MagicMock(spec=CheckInHandler),
         ]
+        self.scheduler.flights = test_flights[:]
+        self.scheduler.checkin_handlers = mock_checkin_handlers[:]
 
         self.scheduler._remove_old_flights([test_flights[1]])
 
-        assert len(self.scheduler.flights) == 1
-        assert len(self.scheduler.checkin_handlers) == 1
-        mock_stop_check_in.assert_called_once()
+        assert self.scheduler.flights == [test_flights[1]]
+        assert self.scheduler.checkin_handlers == [mock_checkin_handlers[1]]
+        mock_checkin_handlers[0].stop_check_in.assert_called_once()
+        mock_checkin_handlers[1].stop_check_in.assert_not_called()